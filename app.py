@@ -1,213 +1,103 @@
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import numpy as np
 import altair as alt
 import logging
 
+from scrapers import CACHE_TTL, add_custom_css, fetch_epl_data, fetch_player_data, fetch_all_data
+
 st.set_page_config(layout="wide")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-# Custom CSS for enhanced styling
-def add_custom_css():
-    st.markdown("""
-        <style>
-        body {
-            background-color: #f7f9fc;
-            font-family: 'Helvetica Neue', Arial, sans-serif;
-            font-size: 16px;
-        }
-        .title {
-            font-size: 2.5em;
-            color: #1e90ff;  /* Dodger Blue */
-            text-align: center;
-            margin-bottom: 15px;
-        }
-        .subheader {
-            font-size: 1.8em;
-            color: #ff6347;  /* Tomato */
-            text-align: center;
-            margin-top: 15px;
-        }
-        .dataframe {
-            font-family: 'Courier New', Courier, monospace;
-        }
-        .stButton>button {
-            background-color: #1e90ff;
-            color: white;
-            font-size: 1em;
-            border-radius: 5px;
-            padding: 8px 16px;
-        }
-        .stSelectbox {
-            margin-bottom: 15px;
-        }
-        @media (max-width: 600px) {
-            .title, .subheader {
-                font-size: 1.5em;
-            }
-            .stButton>button {
-                font-size: 0.9em;
-                padding: 6px 12px;
-            }
-        }
-        </style>
-    """, unsafe_allow_html=True)
-
-
-def fetch_epl_data():
-    url = "https://www.bbc.com/sport/football/premier-league/table"
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Error fetching EPL data: {e}")
-        st.error(f"🚨 Error fetching data: {e}")
-        return pd.DataFrame()
-
-    soup = BeautifulSoup(response.content, 'html.parser')
-    table = soup.find('table')
-
-    if table is None:
-        st.error("🚫 Could not find the EPL table on the page.")
-        return pd.DataFrame()
-
-    headers = [header.text for header in table.find_all('th')]
-    rows = table.find_all('tr')[1:]  # Skip the header row
-
-    table_data = []
-    for row in rows:
-        cols = row.find_all('td')
-        cols = [col.text.strip() for col in cols]
-        table_data.append(cols)
-
-    df = pd.DataFrame(table_data, columns=headers)
-    return df.iloc[:, :-1] if not df.empty else df  # Remove the last column if data exists
-
-
-def fetch_player_data():
-    url = "https://www.bbc.com/sport/football/premier-league/top-scorers"
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Error fetching player data: {e}")
-        st.error(f"🚨 Error fetching data: {e}")
-        return pd.DataFrame()
-
-    soup = BeautifulSoup(response.content, 'html.parser')
-    table = soup.find('table')
-
-    if table is None:
-        st.error("🚫 Could not find the player stats table on the page.")
-        return pd.DataFrame()
-
-    headers = [header.text for header in table.find_all('th')]
-    rows = table.find_all('tr')[1:]  # Skip the header row
-
-    table_data = []
-    for row in rows:
-        cols = row.find_all('td')
-        cols = [col.text.strip() for col in cols]
-        table_data.append(cols)
-
-    df = pd.DataFrame(table_data, columns=headers)
-    
-    # Clean player names and separate them from teams
-    def clean_column(value):
-        return value[:len(value)//2]
-
-    df['Name'] = df['Name'].apply(clean_column)
-    df.drop_duplicates(inplace=True)  # Remove duplicate rows
-    return df
-
-def display_team_stats(df):
+# Derived frames and charts are memoized on their inputs so widget reruns reuse them.
+# Comparison views create a new key per multiselect subset, so entries are bounded.
+DERIVED_CACHE_ENTRIES = 64
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=DERIVED_CACHE_ENTRIES, show_spinner=False)
+def top_n_by(df, col, n, label):
+    # Matches df.nlargest(n, col, keep='first'), but finds the n-th value with a linear-time
+    # partition instead of a full sort. Rows above it always qualify; ties at it go to the
+    # earliest rows, and the final stable sort keeps tied rows in their original order.
+    values = df[col].to_numpy(dtype=float, na_value=np.nan)
+    idx = np.flatnonzero(~np.isnan(values))
+    if len(idx) > n:
+        kth = -np.partition(-values[idx], n - 1)[n - 1]
+        above = idx[values[idx] > kth]
+        tied = idx[values[idx] == kth][:n - len(above)]
+        idx = np.sort(np.concatenate((above, tied)))
+    idx = idx[np.argsort(-values[idx], kind='stable')]
+    return df.iloc[idx][[label, col]]
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=DERIVED_CACHE_ENTRIES, show_spinner=False)
+def search_index(df):
+    # One lowercase string per row; newline separators keep matches from spanning cells
+    return df.astype(str).agg('\n'.join, axis=1).str.lower()
+
+# Caches the serialized Vega-Lite spec, so reruns skip Altair's to_dict() encoding
+@st.cache_data(ttl=CACHE_TTL, max_entries=DERIVED_CACHE_ENTRIES, show_spinner=False)
+def bar_chart_spec(df, x, y, title):
+    return alt.Chart(df).mark_bar().encode(
+        x=x,
+        y=y,
+        color=x
+    ).properties(
+        title=title
+    ).interactive().to_dict()
+
+# Typing in the search box only reruns this fragment, not the charts below it
+@st.fragment
+def team_search_table(df):
     st.markdown('<div class="subheader">EPL Table</div>', unsafe_allow_html=True)
     search_term = st.text_input("🔍 Search the table", "")
     if search_term:
-        search_term = search_term.lower()
-        df = df[df.apply(lambda row: row.astype(str).str.lower().str.contains(search_term).any(), axis=1)]
+        mask = search_index(df).str.contains(search_term.lower(), na=False, regex=False)
+        df = df[mask]
     st.dataframe(df, use_container_width=True)
-    
+
+def team_charts(df):
     if 'Points' in df.columns:
-        df['Points'] = pd.to_numeric(df['Points'], errors='coerce')
-        top_5_teams = df.nlargest(5, 'Points')[['Team', 'Points']]
+        top_5_teams = top_n_by(df, 'Points', 5, 'Team')
         st.markdown('<div class="subheader">🏅 Top 5 Teams </div>', unsafe_allow_html=True)
         st.table(top_5_teams)
 
-        chart = alt.Chart(top_5_teams).mark_bar().encode(
-            x='Team',
-            y='Points',
-            color='Team'
-        ).properties(
-            title='📊 Top 5 Teams by Points'
-        ).interactive()
-        st.altair_chart(chart, use_container_width=True)
+        chart = bar_chart_spec(top_5_teams, 'Team', 'Points', '📊 Top 5 Teams by Points')
+        st.vega_lite_chart(spec=chart, use_container_width=True)
 
         if 'Goals For' in df.columns and 'Goals Against' in df.columns:
             performance = df[['Team', 'Goals For', 'Goals Against']]
             st.markdown('<div class="subheader">⚽ Goals Scored vs. Goals Conceded</div>', unsafe_allow_html=True)
-            goals_scored_chart = alt.Chart(performance).mark_bar().encode(
-                x='Team',
-                y='Goals For',
-                color='Team'
-            ).properties(
-                title='📊 Goals Scored'
-            ).interactive()
-            st.altair_chart(goals_scored_chart, use_container_width=True)
+            goals_scored_chart = bar_chart_spec(performance, 'Team', 'Goals For', '📊 Goals Scored')
+            st.vega_lite_chart(spec=goals_scored_chart, use_container_width=True)
 
-            goals_conceded_chart = alt.Chart(performance).mark_bar().encode(
-                x='Team',
-                y='Goals Against',
-                color='Team'
-            ).properties(
-                title='📊 Goals Conceded'
-            ).interactive()
-            st.altair_chart(goals_conceded_chart, use_container_width=True)
+            goals_conceded_chart = bar_chart_spec(performance, 'Team', 'Goals Against', '📊 Goals Conceded')
+            st.vega_lite_chart(spec=goals_conceded_chart, use_container_width=True)
+
+def display_team_stats(df):
+    team_search_table(df)
+    team_charts(df)
 
 def display_player_stats(player_df):
     st.markdown('<div class="subheader">👤 Player Stats </div>', unsafe_allow_html=True)
     st.dataframe(player_df, use_container_width=True)
 
     if 'Goals' in player_df.columns:
-        player_df['Goals'] = pd.to_numeric(player_df['Goals'], errors='coerce')
-        top_scorers = player_df.nlargest(5, 'Goals')[['Name', 'Goals']]
+        top_scorers = top_n_by(player_df, 'Goals', 5, 'Name')
         st.markdown('<div class="subheader">🏆 Top 5 Scorers</div>', unsafe_allow_html=True)
         st.table(top_scorers)
 
-        chart = alt.Chart(top_scorers).mark_bar().encode(
-            x='Name',
-            y='Goals',
-            color='Name'
-        ).properties(
-            title='📊 Top 5 Scorers by Goals'
-        ).interactive()
-        st.altair_chart(chart, use_container_width=True)
+        chart = bar_chart_spec(top_scorers, 'Name', 'Goals', '📊 Top 5 Scorers by Goals')
+        st.vega_lite_chart(spec=chart, use_container_width=True)
 
         if 'Assists' in player_df.columns:
-            player_df['Assists'] = pd.to_numeric(player_df['Assists'], errors='coerce')
             comparison = player_df[['Name', 'Goals', 'Assists']]
             st.markdown('<div class="subheader">🎯 Goals vs Assists</div>', unsafe_allow_html=True)
             
-            goals_chart = alt.Chart(comparison).mark_bar().encode(
-                x='Name',
-                y='Goals',
-                color='Name'
-            ).properties(
-                title='📊 Goals'
-            ).interactive()
-            st.altair_chart(goals_chart, use_container_width=True)
+            goals_chart = bar_chart_spec(comparison, 'Name', 'Goals', '📊 Goals')
+            st.vega_lite_chart(spec=goals_chart, use_container_width=True)
 
-            assists_chart = alt.Chart(comparison).mark_bar().encode(
-                x='Name',
-                y='Assists',
-                color='Name'
-            ).properties(
-                title='📊 Assists'
-            ).interactive()
-            st.altair_chart(assists_chart, use_container_width=True)
+            assists_chart = bar_chart_spec(comparison, 'Name', 'Assists', '📊 Assists')
+            st.vega_lite_chart(spec=assists_chart, use_container_width=True)
 
 def display_team_comparison(df):
     st.markdown('<div class="subheader">Team Comparison</div>', unsafe_allow_html=True)
@@ -219,36 +109,17 @@ def display_team_comparison(df):
         st.dataframe(comparison_df, use_container_width=True)
 
         if 'Points' in comparison_df.columns:
-            comparison_df['Points'] = pd.to_numeric(comparison_df['Points'], errors='coerce')
-            comparison_chart = alt.Chart(comparison_df).mark_bar().encode(
-                x='Team',
-                y='Points',
-                color='Team'
-            ).properties(
-                title='📊 Points Comparison'
-            ).interactive()
-            st.altair_chart(comparison_chart, use_container_width=True)
+            comparison_chart = bar_chart_spec(comparison_df, 'Team', 'Points', '📊 Points Comparison')
+            st.vega_lite_chart(spec=comparison_chart, use_container_width=True)
 
             if 'Goals For' in comparison_df.columns and 'Goals Against' in comparison_df.columns:
                 goals_comparison = comparison_df[['Team', 'Goals For', 'Goals Against']]
                 st.markdown('<div class="subheader">⚽ Goals Scored vs. Goals Conceded</div>', unsafe_allow_html=True)
-                goals_for_chart = alt.Chart(goals_comparison).mark_bar().encode(
-                    x='Team',
-                    y='Goals For',
-                    color='Team'
-                ).properties(
-                    title='📊 Goals Scored'
-                ).interactive()
-                st.altair_chart(goals_for_chart, use_container_width=True)
+                goals_for_chart = bar_chart_spec(goals_comparison, 'Team', 'Goals For', '📊 Goals Scored')
+                st.vega_lite_chart(spec=goals_for_chart, use_container_width=True)
 
-                goals_against_chart = alt.Chart(goals_comparison).mark_bar().encode(
-                    x='Team',
-                    y='Goals Against',
-                    color='Team'
-                ).properties(
-                    title='📊 Goals Conceded'
-                ).interactive()
-                st.altair_chart(goals_against_chart, use_container_width=True)
+                goals_against_chart = bar_chart_spec(goals_comparison, 'Team', 'Goals Against', '📊 Goals Conceded')
+                st.vega_lite_chart(spec=goals_against_chart, use_container_width=True)
 
 def display_player_comparison(player_df):
     st.markdown('<div class="subheader">Player Comparison</div>', unsafe_allow_html=True)
@@ -260,26 +131,12 @@ def display_player_comparison(player_df):
         st.dataframe(comparison_df, use_container_width=True)
 
         if 'Goals' in comparison_df.columns:
-            comparison_df['Goals'] = pd.to_numeric(comparison_df['Goals'], errors='coerce')
-            goals_chart = alt.Chart(comparison_df).mark_bar().encode(
-                x='Name',
-                y='Goals',
-                color='Name'
-            ).properties(
-                title='📊 Goals Comparison'
-            ).interactive()
-            st.altair_chart(goals_chart, use_container_width=True)
+            goals_chart = bar_chart_spec(comparison_df, 'Name', 'Goals', '📊 Goals Comparison')
+            st.vega_lite_chart(spec=goals_chart, use_container_width=True)
 
         if 'Assists' in comparison_df.columns:
-            comparison_df['Assists'] = pd.to_numeric(comparison_df['Assists'], errors='coerce')
-            assists_chart = alt.Chart(comparison_df).mark_bar().encode(
-                x='Name',
-                y='Assists',
-                color='Name'
-            ).properties(
-                title='📊 Assists Comparison'
-            ).interactive()
-            st.altair_chart(assists_chart, use_container_width=True)
+            assists_chart = bar_chart_spec(comparison_df, 'Name', 'Assists', '📊 Assists Comparison')
+            st.vega_lite_chart(spec=assists_chart, use_container_width=True)
 
 def main():
     add_custom_css()
@@ -288,7 +145,7 @@ def main():
     
     option = st.sidebar.selectbox(
         "Choose an option",
-        ["📊 Team Stats", "👤 Player Stats", "⚖️ Team Comparison", "⚖️ Player Comparison"]
+        ["📊 Team Stats", "👤 Player Stats", "⚖️ Team Comparison", "⚖️ Player Comparison", "🗂️ Dashboard"]
     )
     
     if option == "📊 Team Stats":
@@ -310,6 +167,13 @@ def main():
         player_df = fetch_player_data()
         if not player_df.empty:
             display_player_comparison(player_df)
+    
+    elif option == "🗂️ Dashboard":
+        df, player_df = fetch_all_data()
+        if not df.empty:
+            display_team_stats(df)
+        if not player_df.empty:
+            display_player_stats(player_df)
 
 if __name__ == "__main__":
     main()
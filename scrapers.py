@@ -0,0 +1,153 @@
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import requests
+from requests.adapters import HTTPAdapter
+import requests_cache
+import pandas as pd
+import numpy as np
+import logging
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+# Scraped pages are re-fetched at most every five minutes per Streamlit process
+CACHE_TTL = 300
+
+# Shared HTTP session so repeated scrapes reuse pooled keep-alive connections.
+# Responses are cached on disk and revalidated with ETag/Last-Modified once stale.
+# This layer sits under st.cache_data with the same TTL, so data can be up to
+# 2 * CACHE_TTL old when a frame is parsed from an already nearly stale response.
+_SESSION = requests_cache.CachedSession('bbc_epl', backend='sqlite', expire_after=CACHE_TTL)
+_SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; PremierLeagueStats)'})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+_TIMEOUT = (3, 10)  # (connect, read) seconds
+
+# Columns are typed once at fetch time so the display views get compact, typed data
+TEAM_NUMERIC_COLUMNS = ('Played', 'Won', 'Drawn', 'Lost', 'Goals For', 'Goals Against', 'Goal Difference', 'Points')
+PLAYER_NUMERIC_COLUMNS = ('Goals', 'Assists')
+CATEGORY_COLUMNS = ('Team', 'Name')
+
+def to_numeric_columns(df, columns):
+    # downcast='integer' picks the smallest integer type that fits, int8 for most league stats
+    for col in columns:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce', downcast='integer')
+    return df
+
+def to_category_columns(df, columns=CATEGORY_COLUMNS):
+    # Team and player names repeat only a handful of values, so store them as categories
+    for col in columns:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+# Custom CSS for enhanced styling, built once at import
+CUSTOM_CSS = """
+        <style>
+        body {
+            background-color: #f7f9fc;
+            font-family: 'Helvetica Neue', Arial, sans-serif;
+            font-size: 16px;
+        }
+        .title {
+            font-size: 2.5em;
+            color: #1e90ff;  /* Dodger Blue */
+            text-align: center;
+            margin-bottom: 15px;
+        }
+        .subheader {
+            font-size: 1.8em;
+            color: #ff6347;  /* Tomato */
+            text-align: center;
+            margin-top: 15px;
+        }
+        .dataframe {
+            font-family: 'Courier New', Courier, monospace;
+        }
+        .stButton>button {
+            background-color: #1e90ff;
+            color: white;
+            font-size: 1em;
+            border-radius: 5px;
+            padding: 8px 16px;
+        }
+        .stSelectbox {
+            margin-bottom: 15px;
+        }
+        @media (max-width: 600px) {
+            .title, .subheader {
+                font-size: 1.5em;
+            }
+            .stButton>button {
+                font-size: 0.9em;
+                padding: 6px 12px;
+            }
+        }
+        </style>
+"""
+
+def add_custom_css():
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+
+# The cached scrapers raise on failure so that only successful results are cached;
+# the uncached fetch_* wrappers below turn failures into an error message and an empty frame.
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _scrape_epl_table():
+    url = "https://www.bbc.com/sport/football/premier-league/table"
+    response = _SESSION.get(url, timeout=_TIMEOUT)
+    response.raise_for_status()
+
+    # pd.read_html raises ValueError when the page contains no <table>
+    df = pd.read_html(io.BytesIO(response.content), flavor='lxml')[0]
+    if df.empty:
+        return df
+    df = df.iloc[:, :-1].copy()  # Remove the last column
+    return to_category_columns(to_numeric_columns(df, TEAM_NUMERIC_COLUMNS))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _scrape_player_table():
+    url = "https://www.bbc.com/sport/football/premier-league/top-scorers"
+    response = _SESSION.get(url, timeout=_TIMEOUT)
+    response.raise_for_status()
+
+    # pd.read_html raises ValueError when the page contains no <table>
+    df = pd.read_html(io.BytesIO(response.content), flavor='lxml')[0]
+    
+    # Clean player names and separate them from teams
+    names = df['Name'].fillna('').to_numpy(dtype=str)  # read_html leaves empty cells as NaN
+    halves = np.char.str_len(names) // 2
+    df['Name'] = [name[:half] for name, half in zip(names, halves)]
+    df.drop_duplicates(inplace=True)  # Remove duplicate rows
+    return to_category_columns(to_numeric_columns(df, PLAYER_NUMERIC_COLUMNS))
+
+
+def fetch_epl_data():
+    try:
+        return _scrape_epl_table()
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Error fetching EPL data: {e}")
+        st.error(f"🚨 Error fetching data: {e}")
+    except ValueError:
+        st.error("🚫 Could not find the EPL table on the page.")
+    return pd.DataFrame()
+
+
+def fetch_player_data():
+    try:
+        return _scrape_player_table()
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Error fetching player data: {e}")
+        st.error(f"🚨 Error fetching data: {e}")
+    except ValueError:
+        st.error("🚫 Could not find the player stats table on the page.")
+    return pd.DataFrame()
+
+def fetch_all_data():
+    # Run the independent scrapes concurrently so their network round-trips overlap.
+    # Worker threads get the script run context so st.error() still renders.
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=2, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        epl_future = executor.submit(fetch_epl_data)
+        player_future = executor.submit(fetch_player_data)
+        return epl_future.result(), player_future.result()